@@ -13,42 +13,35 @@ __all__ = (
     "sleep",
 )
 
-from collections import deque
 from types import coroutine as _coroutine
 from typing import TYPE_CHECKING, overload
 
 if TYPE_CHECKING:
     from typing import Any, ParamSpec, TypeVar
-    from collections.abc import AsyncIterable, Awaitable, Generator, Iterable
+    from collections.abc import AsyncIterable, Coroutine, Generator, Iterable
 
     P = ParamSpec("P")
     T = TypeVar("T")
 
 
 @_coroutine
-def _sleep() -> Generator[None, None, None]:
-    """
-    Low-level implementation of sleep().
-    """
-    yield
-
-
-async def sleep() -> None:
+def sleep() -> Generator[None, None, None]:
     """
     Suspend the current chain of coroutines.
     """
-    await _sleep()
+    yield
 
 
 @overload
-async def awaitable(obj: None = None) -> None: ...
+def awaitable(obj: None = None) -> Coroutine[Any, Any, None]: ...
 @overload
-async def awaitable(obj: T) -> T: ...
-async def awaitable(obj: T | None = None) -> T | None:
+def awaitable(obj: T) -> Coroutine[Any, Any, T]: ...
+@_coroutine
+def awaitable(obj: T | None = None) -> Generator[None, None, Any]:
     """
     Returns *obj* and suspends the current chain of coroutines.
     """
-    await _sleep()
+    yield
     return obj
 
 
@@ -57,7 +50,7 @@ async def aiterable(iterable: Iterable[T]) -> AsyncIterable[T]:
     Returns an async iterable that sleeps after every item.
     """
     for obj in iterable:
-        await _sleep()
+        await sleep()
         yield obj
 
 
@@ -66,44 +59,74 @@ async def arange(*args: int) -> AsyncIterable[int]:
     Async variant of ``range()``.
     """
     for i in range(*args):
-        await _sleep()
+        await sleep()
         yield i
 
 
-async def gather(*aws: Awaitable[T]) -> list[T]:
+@_coroutine
+def gather(
+    *coros: Coroutine[Any, Any, T],
+    close_on_error: bool = False,
+) -> Generator[None, None, list[T]]:
     """
-    Concurrently gather results from the given awaitables into a list
-    with the same order.
+    Concurrently gather results from the given coroutines into a list
+    with the same order.  If *close_on_error* is true, coroutines that
+    are still running are closed when an exception is raised.
     """
 
     results: list[Any]
-    queue: deque[tuple[int, Awaitable[T]] | None]
-
-    results = [None] * len(aws)
-    queue = deque(enumerate(aws))
-    queue.append(None)
-    while len(queue) > 1:
-        if queue[0] is None:
-            await _sleep()
-            queue.rotate(-1)
-        else:
-            index, coro = queue[0]
-            try:
-                next(coro.__await__())
-                queue.rotate(-1)
-            except StopIteration as exc:
-                results[index] = exc.value
-                queue.popleft()
-    return results
-
-
-def run(coro: Awaitable[T]) -> T:
+    live: list[tuple[int, Coroutine[Any, Any, T], Any]]
+
+    n = len(coros)
+    if n == 0:
+        return []
+
+    # each entry of the live list holds everything needed to resume a
+    # coroutine and store its result; finished entries are dropped from
+    # the list by compacting it in place, which keeps the order
+    results = [None] * n
+    live = [(i, coro, coro.send) for i, coro in enumerate(coros)]
+    try:
+        # fast path: a single coroutine is stepped without the sweep
+        if n == 1:
+            _, _, send = live[0]
+            while True:
+                try:
+                    send(None)
+                except StopIteration as exc:
+                    return [exc.value]
+                yield
+        while True:
+            k = 0
+            for entry in live:
+                i, _, send = entry
+                try:
+                    send(None)
+                except StopIteration as exc:
+                    results[i] = exc.value
+                else:
+                    live[k] = entry
+                    k += 1
+            del live[k:]
+            if not live:
+                return results
+            yield
+    finally:
+        # after an exception, the live list can contain duplicate and
+        # finished entries, but closing those again is harmless
+        if close_on_error:
+            for _, coro, _ in live:
+                coro.close()
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
     """
     Run a coroutine and return its result.
     """
 
-    while True:
-        try:
-            next(coro.__await__())
-        except StopIteration as exc:
-            return exc.value  # type: ignore [no-any-return]
+    send = coro.send
+    try:
+        while True:
+            send(None)
+    except StopIteration as exc:
+        return exc.value  # type: ignore [no-any-return]
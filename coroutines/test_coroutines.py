@@ -1,3 +1,5 @@
+import inspect
+
 import pytest
 
 import coroutines
@@ -58,6 +60,13 @@ def test_awaitable():
     with run(coroutines.awaitable(obj), 1) as result:
         assert result is obj
 
+    # make sure that awaitable() can be awaited from a coroutine
+    async def f():
+        return await coroutines.awaitable(obj)
+
+    with run(f(), 1) as result:
+        assert result is obj
+
 
 def test_aiterable():
     async def f():
@@ -100,6 +109,41 @@ def test_gather():
         assert result == [1, 2, 3]
         assert called == [1, 2, 3, 1, 2, 1, 2, 2, 2]
 
+    # finished coroutines are dropped without changing the order
+    coro = coroutines.gather(f3(), f1(), f2())
+    called = []
+    with run(coro, 5) as result:
+        assert result == [3, 1, 2]
+        assert called == [3, 1, 2, 1, 2, 1, 2, 2, 2]
+
+    # coroutines that finish without awaiting do not suspend gather()
+    coro = coroutines.gather(f3(), f3())
+    called = []
+    with run(coro) as result:
+        assert result == [3, 3]
+        assert called == [3, 3]
+
+    # no coroutines
+    with run(coroutines.gather()) as result:
+        assert result == []
+
+    # single coroutine is stepped without the sweep, suspending as often as it does
+    coro = coroutines.gather(f1())
+    called = []
+    with run(coro, 3) as result:
+        assert result == [1]
+        assert called == [1, 1, 1]
+
+    # closing a single-coroutine gather() leaves the coroutine running
+    c1 = f1()
+    coro = coroutines.gather(c1)
+    called = []
+    coro.send(None)
+    coro.close()
+    assert inspect.getcoroutinestate(c1) == inspect.CORO_SUSPENDED
+    with run(c1, 2) as result:
+        assert result == 1
+
     # nested calling
     coro = coroutines.gather(
         coroutines.gather(f1(), f2()),
@@ -134,6 +178,33 @@ def test_gather_error():
     with run(c2) as result:
         assert result == "second"
 
+    async def third():
+        await coroutines.sleep()
+        return "third"
+
+    # with close_on_error, running coroutines are closed
+    c1, c2, c3 = third(), first(), second()
+    with pytest.raises(ValueError):
+        with run(coroutines.gather(c1, c2, c3, close_on_error=True)):
+            pass
+    assert inspect.getcoroutinestate(c1) == inspect.CORO_CLOSED
+    assert inspect.getcoroutinestate(c3) == inspect.CORO_CLOSED
+
+    # with close_on_error, closing gather() closes running coroutines
+    c1, c2 = third(), third()
+    coro = coroutines.gather(c1, c2, close_on_error=True)
+    coro.send(None)
+    coro.close()
+    assert inspect.getcoroutinestate(c1) == inspect.CORO_CLOSED
+    assert inspect.getcoroutinestate(c2) == inspect.CORO_CLOSED
+
+    # same for a single coroutine
+    c1 = third()
+    coro = coroutines.gather(c1, close_on_error=True)
+    coro.send(None)
+    coro.close()
+    assert inspect.getcoroutinestate(c1) == inspect.CORO_CLOSED
+
 
 def test_run():
     async def f():
@@ -141,3 +212,8 @@ def test_run():
         return "done"
 
     assert coroutines.run(f()) == "done"
+
+    # generator-based coroutines are stepped in the same way
+    assert coroutines.run(coroutines.awaitable("done")) == "done"
+    coro = coroutines.gather(coroutines.awaitable(1), coroutines.sleep())
+    assert coroutines.run(coro) == [1, None]